@@ -12,6 +12,20 @@ __all__ = [
     "KernelBridge",
 ]
 
-# 延迟导入，避免循环依赖
-from .domain.self.self_entity import SelrenaSelfEntity
-from .adapters.outbound.kernel_bridge import KernelBridge
+# 延迟导入（PEP 562）：导入任意 selrena 子模块时不再连带加载自我实体全家桶与 zmq，
+# 仅在首次访问对外入口时才真正导入，同时避免循环依赖
+_LAZY_EXPORTS = {
+    "SelrenaSelfEntity": ".domain.self.self_entity",
+    "KernelBridge": ".adapters.outbound.kernel_bridge",
+}
+
+
+def __getattr__(name: str):
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
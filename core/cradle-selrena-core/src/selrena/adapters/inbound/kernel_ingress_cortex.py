@@ -28,7 +28,7 @@ class KernelIngressCortex:
         envelope = KernelMessageEnvelope.model_validate(message)
         payload = PerceptionEventPayloadModel.model_validate(envelope.payload)
         return ChatInput(
-            model_input=payload.content.model_dump(),
+            model_input=payload.content,
             scene_id=payload.source,
             familiarity=payload.familiarity,
             trace_id=envelope.trace_id,
@@ -36,7 +36,9 @@ class KernelBridge:
 
     def _init(self) -> None:
         """初始化，仅在单例创建时执行一次"""
-        self._context = zmq.asyncio.Context()
+        # ZMQ 上下文延迟到 start() 时创建：容器装配阶段不启动 ZMQ IO 线程，
+        # stop() 终止后也可重新 start()
+        self._context: zmq.asyncio.Context | None = None
         self._socket: zmq.asyncio.Socket | None = None
         self._handlers: dict[str, Callable[[dict], Coroutine[Any, Any, Any]]] = {}
         self._is_running: bool = False
@@ -53,7 +55,7 @@ class KernelBridge:
             handler: 异步处理函数，入参为消息字典
         """
         self._handlers[message_type] = handler
-        logger.info(f"注册消息处理器: {message_type}")
+        logger.info("注册消息处理器", message_type=message_type)
 
     async def start(self, connect_address: str) -> None:
         """
@@ -68,11 +70,13 @@ class KernelBridge:
             return
 
         try:
+            if self._context is None:
+                self._context = zmq.asyncio.Context()
             self._socket = self._context.socket(zmq.DEALER)
             self._socket.connect(connect_address)
             self._is_running = True
             self._receive_task = asyncio.create_task(self._receive_loop())
-            logger.info(f"内核桥接启动成功，连接地址: {connect_address}")
+            logger.info("内核桥接启动成功", connect_address=connect_address)
 
         except Exception as e:
             raise BridgeException(f"内核桥接启动失败: {str(e)}")
@@ -97,7 +101,9 @@ class KernelBridge:
             self._socket.close()
             self._socket = None
 
-        self._context.term()
+        if self._context is not None:
+            self._context.term()
+            self._context = None
         logger.info("内核桥接已停止")
 
     async def send_message(self, message: dict) -> None:
@@ -165,7 +171,8 @@ class KernelBridge:
             raise
         except Exception as e:
             logger.error(
-                f"消息处理器执行失败: {str(e)}",
+                "消息处理器执行失败",
+                error=str(e),
                 message_type=message_type,
                 trace_id=trace_id,
                 exc_info=True
@@ -226,7 +233,7 @@ class KernelBridge:
                     continue
 
                 if not handler:
-                    logger.warning(f"未找到消息类型 {message_type} 的处理器")
+                    logger.warning("未找到消息类型对应的处理器", message_type=message_type)
                     continue
 
                 task = asyncio.create_task(self._run_handler_task(message, handler))
@@ -235,8 +242,8 @@ class KernelBridge:
 
             except zmq.ZMQError as e:
                 if self._is_running:
-                    logger.error(f"ZMQ通信错误: {str(e)}", exc_info=True)
+                    logger.error("ZMQ通信错误", error=str(e), exc_info=True)
                 await asyncio.sleep(0.1)
             except Exception as e:
-                logger.error(f"消息接收循环异常: {str(e)}", exc_info=True)
+                logger.error("消息接收循环异常", error=str(e), exc_info=True)
                 await asyncio.sleep(0.1)
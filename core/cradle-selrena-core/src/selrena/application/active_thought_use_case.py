@@ -7,7 +7,7 @@
 2. 完全由内核驱动，无需用户触发
 3. 不碰任何场景规则，仅做纯思维生成
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import ClassVar
 from .base_use_case import BaseUseCase
 from selrena.domain.self.self_entity import SelrenaSelfEntity
@@ -53,6 +53,14 @@ class ActiveThoughtUseCase(BaseUseCase[ActiveThoughtInput, ActiveThoughtOutput])
     # 依赖注入：全局自我实体
     lifecycle_log_level: ClassVar[str] = "debug"
     self_entity: SelrenaSelfEntity
+    # 允许生成主动思维的注意力模式（配置冻结，构造时预计算一次）
+    _active_modes: frozenset[str] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        self._active_modes = frozenset(
+            getattr(self.self_entity.inference_config.life_clock, "active_thought_modes", ["ambient", "focused"])
+        )
 
     async def _execute(self, input_data: ActiveThoughtInput, trace_id: str) -> ActiveThoughtOutput:
         """主动思维全流程编排"""
@@ -69,13 +77,12 @@ class ActiveThoughtUseCase(BaseUseCase[ActiveThoughtInput, ActiveThoughtOutput])
         logger.debug("情绪自然衰减完成", trace_id=trace_id, emotion=current_emotion)
 
         # 仅在配置允许的注意力模式下生成主动思维
-        active_modes = set(getattr(self.self_entity.inference_config.life_clock, "active_thought_modes", ["ambient", "focused"]))
-        if input_data.attention_mode not in active_modes:
+        if input_data.attention_mode not in self._active_modes:
             logger.debug(
                 "当前注意力模式不生成主动思维，跳过",
                 trace_id=trace_id,
                 attention_mode=input_data.attention_mode,
-                active_modes=list(active_modes),
+                active_modes=list(self._active_modes),
             )
             return ActiveThoughtOutput(
                 thought_content="",
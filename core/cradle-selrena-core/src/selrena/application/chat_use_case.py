@@ -32,11 +32,15 @@ _EMOTION_TAG_RE = re.compile(
     r'[\[\(（【《<]\s*(?:emotion|情绪)?\s*[:：\-]?\s*(?:' + _EMOTION_LABEL_WORDS + r')\s*[\]\)）】》>]',
     re.IGNORECASE,
 )
-# 无括号前缀格式（仅行首）：emotion: happy 情绪：开心
+# 无括号前缀格式（仅行首，允许前导空白）：emotion: happy 情绪：开心
 _EMOTION_PREFIX_RE = re.compile(
-    r'^(?:emotion|情绪)\s*[:：]\s*(?:' + _EMOTION_LABEL_WORDS + r')\s*',
+    r'^\s*(?:emotion|情绪)\s*[:：]\s*(?:' + _EMOTION_LABEL_WORDS + r')\s*',
     re.IGNORECASE,
 )
+# 剥除标签后遗留的连续空格
+_MULTI_SPACE_RE = re.compile(r' {2,}')
+# _EMOTION_TAG_RE 可能的起始括号；文本中一个都没有时无需运行该正则
+_EMOTION_TAG_OPENERS = '[(（【《<'
 
 
 def _strip_emotion_tags(text: str) -> str:
@@ -46,15 +50,44 @@ def _strip_emotion_tags(text: str) -> str:
       - 括号格式（任意位置）：[开心] [emotion:happy] (shy) 等
       - 无括号前缀（行首）：emotion: happy / 情绪：开心
     """
-    value = _EMOTION_TAG_RE.sub('', text).strip()
-    value = _EMOTION_PREFIX_RE.sub('', value).strip()
-    return re.sub(r' {2,}', ' ', value).strip()
+    # 绝大多数回复不含括号：先做几次 C 级子串扫描，命中任一括号才跑标签正则
+    if any(opener in text for opener in _EMOTION_TAG_OPENERS):
+        text = _EMOTION_TAG_RE.sub('', text)
+    # 前缀正则自带前导空白匹配，两步处理后只需收尾 strip 一次
+    value = _EMOTION_PREFIX_RE.sub('', text).strip()
+    if '  ' in value:
+        value = _MULTI_SPACE_RE.sub(' ', value).strip()
+    return value
 
 
 # 初始化模块日志器
 logger = get_logger("chat_use_case")
 
 
+# ======================================
+# 系统消息分段模板（模块加载时确定，逐轮仅拼接正文）
+# ======================================
+_SESSION_MECHANISM_SECTION = (
+    "===== 会话机制 =====\n"
+    "你正在一个持续在线的长会话中回复，必须承接历史上下文，不要把每一轮都当成第一次见面。"
+)
+# (段标题, 正文为空时的占位)，顺序与 _build_system_message 的正文一一对应
+_SYSTEM_SECTIONS: tuple[tuple[str, str], ...] = (
+    ("===== 当前情绪状态 =====\n", ""),
+    ("===== 历史会话摘要 =====\n", "无历史摘要"),
+    ("===== 短期记忆摘录 =====\n", "无短期记忆摘录"),
+    ("===== 长期偏好记忆 =====\n", "无长期偏好记忆"),
+    ("===== 相关长期记忆 =====\n", "无相关记忆"),
+    ("===== 人设固定知识 =====\n", "无人设固定知识"),
+    ("===== 相关通用知识 =====\n", "无相关知识"),
+    (
+        "===== 用户发送的媒体内容 =====\n"
+        "（以下是对用户发来的图片/表情包/视频的简要描述，请自然地参考这些内容进行回复，不要逐字复述描述词）\n",
+        "无图片或视频",
+    ),
+)
+
+
 # ======================================
 # 用例输入/输出模型
 # ======================================
@@ -101,9 +134,7 @@ class ChatUseCase(BaseUseCase[ChatInput, ChatOutput]):
     # 依赖注入：多模态路由器
     multimodal_router: MultimodalRouter
 
-    def _build_memory_digest(self, input_data: ChatInput, user_text: str, multimodal_text: str) -> tuple[str, str, str, str]:
-        memory_query = "\n".join(part for part in [user_text, multimodal_text] if part).strip() or user_text
-
+    def _build_memory_digest(self, memory_query: str) -> tuple[str, str, str, str]:
         preference_memories = self.self_entity.long_term_memory.get_preference_memory()
         preference_text = "\n".join([f"偏好记忆：{mem.content}" for mem in preference_memories])
 
@@ -145,37 +176,22 @@ class ChatUseCase(BaseUseCase[ChatInput, ChatOutput]):
         knowledge_text: str,
         multimodal_text: str,
     ) -> str:
-        return f"""
-{persona_prompt}
-
-===== 会话机制 =====
-你正在一个持续在线的长会话中回复，必须承接历史上下文，不要把每一轮都当成第一次见面。
-
-===== 当前情绪状态 =====
-{current_emotion}
-
-===== 历史会话摘要 =====
-{session_summary if session_summary else "无历史摘要"}
-
-===== 短期记忆摘录 =====
-{short_term_digest if short_term_digest else "无短期记忆摘录"}
-
-===== 长期偏好记忆 =====
-{preference_text if preference_text else "无长期偏好记忆"}
-
-===== 相关长期记忆 =====
-{memory_text if memory_text else "无相关记忆"}
-
-===== 人设固定知识 =====
-{persona_knowledge_text if persona_knowledge_text else "无人设固定知识"}
-
-===== 相关通用知识 =====
-{knowledge_text if knowledge_text else "无相关知识"}
-
-===== 用户发送的媒体内容 =====
-（以下是对用户发来的图片/表情包/视频的简要描述，请自然地参考这些内容进行回复，不要逐字复述描述词）
-{multimodal_text if multimodal_text else "无图片或视频"}
-""".strip()
+        bodies = (
+            str(current_emotion),
+            session_summary,
+            short_term_digest,
+            preference_text,
+            memory_text,
+            persona_knowledge_text,
+            knowledge_text,
+            multimodal_text,
+        )
+        parts = [persona_prompt, _SESSION_MECHANISM_SECTION]
+        parts.extend(
+            header + (body or fallback)
+            for (header, fallback), body in zip(_SYSTEM_SECTIONS, bodies, strict=True)
+        )
+        return "\n\n".join(parts).strip()
 
     async def _execute(self, input_data: ChatInput, trace_id: str) -> ChatOutput:
         """
@@ -190,6 +206,9 @@ class ChatUseCase(BaseUseCase[ChatInput, ChatOutput]):
         )
 
         runtime = self.self_entity.get_scene_runtime(input_data.scene_id)
+        # 推理配置冻结不可变，本轮内多次读取的配置节点只解析一次
+        inference_config = self.self_entity.inference_config
+        memory_config = inference_config.memory
         async with runtime.lock:
             # ======================================
             # 步骤0：统一输入路由（固定策略）
@@ -220,7 +239,7 @@ class ChatUseCase(BaseUseCase[ChatInput, ChatOutput]):
             ]
             # core_direct 时使用多模态专用推理提供商，否则走默认
             vision_provider_key: str | None = (
-                self.self_entity.inference_config.multimodal.core_model
+                inference_config.multimodal.core_model
                 if vision_llm_messages
                 else None
             )
@@ -228,8 +247,9 @@ class ChatUseCase(BaseUseCase[ChatInput, ChatOutput]):
             # ======================================
             # 步骤1：情绪更新（基于用户输入）
             # ======================================
-            emotion_input = "\n".join(part for part in [user_text, multimodal_text] if part).strip() or user_text
-            self.self_entity.emotion_system.update_by_input(emotion_input)
+            # 情绪判定与记忆检索共用同一份合并文本，只拼接一次
+            perceived_text = "\n".join(part for part in [user_text, multimodal_text] if part).strip() or user_text
+            self.self_entity.emotion_system.update_by_input(perceived_text)
             current_emotion = self.self_entity.emotion_system.get_state()
             logger.debug("情绪更新完成", trace_id=trace_id, emotion=current_emotion)
 
@@ -237,9 +257,7 @@ class ChatUseCase(BaseUseCase[ChatInput, ChatOutput]):
             # 步骤2：构建长期记忆 / 知识上下文
             # ======================================
             preference_text, memory_text, persona_knowledge_text, knowledge_text = self._build_memory_digest(
-                input_data=input_data,
-                user_text=user_text,
-                multimodal_text=multimodal_text,
+                memory_query=perceived_text,
             )
             logger.debug("长期上下文构建完成", trace_id=trace_id)
 
@@ -259,9 +277,9 @@ class ChatUseCase(BaseUseCase[ChatInput, ChatOutput]):
                 importance=user_importance,
             )
             session.compact_history(
-                trigger_count=self.self_entity.inference_config.memory.summary_trigger_count,
-                keep_recent_count=self.self_entity.inference_config.memory.summary_keep_recent_count,
-                max_summary_chars=self.self_entity.inference_config.memory.summary_max_chars,
+                trigger_count=memory_config.summary_trigger_count,
+                keep_recent_count=memory_config.summary_keep_recent_count,
+                max_summary_chars=memory_config.summary_max_chars,
             )
             short_term_digest = self._build_short_term_digest(input_data.scene_id)
             system_message = self._build_system_message(
@@ -283,7 +301,7 @@ class ChatUseCase(BaseUseCase[ChatInput, ChatOutput]):
                     *[
                         LLMMessage(role=message.role, content=message.content)
                         for message in session.get_recent_messages(
-                            limit=self.self_entity.inference_config.memory.conversation_window,
+                            limit=memory_config.conversation_window,
                         )
                     ],
                 ]
@@ -317,9 +335,9 @@ class ChatUseCase(BaseUseCase[ChatInput, ChatOutput]):
             clean_reply = _strip_emotion_tags(raw_reply)
             session.append_message(role="assistant", content=clean_reply)
             session.compact_history(
-                trigger_count=self.self_entity.inference_config.memory.summary_trigger_count,
-                keep_recent_count=self.self_entity.inference_config.memory.summary_keep_recent_count,
-                max_summary_chars=self.self_entity.inference_config.memory.summary_max_chars,
+                trigger_count=memory_config.summary_trigger_count,
+                keep_recent_count=memory_config.summary_keep_recent_count,
+                max_summary_chars=memory_config.summary_max_chars,
             )
             short_term_memory.add(
                 role="selrena",
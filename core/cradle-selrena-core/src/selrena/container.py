@@ -8,7 +8,6 @@
 3. 所有依赖通过构造函数注入，不使用硬编码导入
 4. 严格遵循分层边界，仅在根目录初始化时调用
 """
-from typing import Final
 from selrena.core.config import GlobalAIConfig
 from selrena.domain.self.self_entity import SelrenaSelfEntity
 from selrena.inference.llm_engine import LLMEngine
@@ -39,9 +38,11 @@ class DIContainer:
         """单例模式"""
         if cls._instance is None:
             cls._instance = super().__new__(cls)
+            cls._instance._init()
         return cls._instance
 
-    def __init__(self):
+    def _init(self) -> None:
+        """初始化实例状态，仅在单例创建时执行一次（再次 DIContainer() 不会清空已装配实例）"""
         self._initialized: bool = False
         # 所有实例存储
         self._instances: dict[str, object] = {}
@@ -4,12 +4,16 @@
 核心作用：进程内领域事件总线，实现模块间解耦通信，无直接硬编码依赖
 设计原则：发布-订阅模式，异步非阻塞，仅做事件分发，无任何业务逻辑
 """
-from typing import Callable, Type, Dict, List
+from typing import Callable, Type, Dict, List, Set
 from abc import ABC
 from dataclasses import dataclass, field
 from uuid import uuid4
 from datetime import datetime
 import asyncio
+from selrena.core.observability.logger import get_logger
+
+# 初始化模块日志器
+logger = get_logger("event_bus")
 
 
 # ======================================
@@ -48,6 +52,8 @@ class DomainEventBus:
         """初始化事件处理器存储，仅在单例创建时执行一次"""
         # 事件处理器字典：key=事件类型，value=处理器函数列表
         self._handlers: Dict[Type[DomainEvent], List[Callable]] = {}
+        # 后台发布中的任务：事件循环只持有 Task 的弱引用，需在此保留强引用直至完成
+        self._background_tasks: Set[asyncio.Task] = set()
 
     def subscribe(self, event_type: Type[DomainEvent], handler: Callable) -> None:
         """
@@ -67,23 +73,38 @@ class DomainEventBus:
             event: 要发布的事件实例
         规范：单个处理器异常不影响其他处理器执行，不会吞异常
         """
-        handlers = self._handlers.get(type(event), [])
+        handlers = self._handlers.get(type(event))
         if not handlers:
             return
 
-        # 包装处理器，捕获单个处理器的异常，避免连锁崩溃
-        async def wrapped_handler(handler: Callable, e: DomainEvent) -> None:
-            try:
-                await handler(e)
-            except Exception as ex:
-                try:
-                    from selrena.core.observability.logger import get_logger
-                    logger = get_logger("event_bus")
-                    logger.error("事件处理器执行异常", error=str(ex), exc_info=True)
-                except Exception:
-                    # 回退到 print，以防 logger 尚未可用
-                    print(f"[事件总线] 处理器执行异常: {str(ex)}")
+        # 单订阅者是最常见的情况：直接等待，省去 gather 的 Task/Future 开销
+        if len(handlers) == 1:
+            await self._run_handler(handlers[0], event)
+            return
+
+        # 多订阅者并发执行
+        tasks = [self._run_handler(h, event) for h in handlers]
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def publish_background(self, event: DomainEvent) -> None:
+        """
+        在当前事件循环中后台发布事件，不阻塞调用方（供同步代码路径使用）
+        参数：
+            event: 要发布的事件实例
+        规范：无运行中的事件循环（如单元测试）时静默跳过
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(self.publish(event))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
 
-        # 并发执行所有处理器
-        tasks = [wrapped_handler(h, event) for h in handlers]
-        await asyncio.gather(*tasks, return_exceptions=True)
\ No newline at end of file
+    @staticmethod
+    async def _run_handler(handler: Callable, event: DomainEvent) -> None:
+        """执行单个处理器，捕获其异常，避免连锁崩溃"""
+        try:
+            await handler(event)
+        except Exception as ex:
+            logger.error("事件处理器执行异常", error=str(ex), exc_info=True)
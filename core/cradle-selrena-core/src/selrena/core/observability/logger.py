@@ -6,16 +6,19 @@
             设置 PRETTY_LOGS=1 可在开发时切换为人类可读的彩色格式
 • 文件      始终输出 JSON，便于后续离线分析
 • 轮转策略  主日志 10 MB × 5；错误日志 5 MB × 3
+• 异步写盘  文件 handler 挂在 QueueListener 后台线程上，调用方只负责入队
 • 幂等性    重复 import 或调用不会重复添加 handler
 • 未捕获异常 通过 sys.excepthook 捕获并写入 CRITICAL 级别日志
 """
 
 from __future__ import annotations
 
+import atexit
 import logging
 import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Any
 
@@ -79,6 +82,22 @@ def _make_console_formatter() -> ProcessorFormatter:
     )
 
 
+# ──────────────────────────────────────────────────────────────────────────────
+# 文件日志异步队列
+# ──────────────────────────────────────────────────────────────────────────────
+
+class _RecordQueueHandler(QueueHandler):
+    """
+    原样入队的 QueueHandler。
+    默认 prepare() 会在调用线程上先 format 一遍并把 msg 改写为字符串，
+    这会丢掉 structlog 的事件字典，也正是需要移出热路径的开销；
+    这里直接把 LogRecord 交给后台线程，由各文件 handler 的 ProcessorFormatter 渲染。
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # 未捕获异常 hook
 # ──────────────────────────────────────────────────────────────────────────────
@@ -123,7 +142,6 @@ def _configure_std_logging() -> None:
         return
     _initialized = True
 
-    log_dir = _resolve_log_dir()
     level_name = os.environ.get("LOG_LEVEL", "INFO").upper()
     level = getattr(logging, level_name, logging.INFO)
 
@@ -142,6 +160,8 @@ def _configure_std_logging() -> None:
     # 如需 Python 侧独立文件日志，可设置 PYTHON_FILE_LOGGING=1。
     enable_file_logging = os.environ.get("PYTHON_FILE_LOGGING", "0").lower() in ("1", "true", "yes")
     if enable_file_logging:
+        # 仅在启用文件日志时才解析并创建日志目录，默认 stdout 模式启动时不触碰文件系统
+        log_dir = _resolve_log_dir()
         main_handler = RotatingFileHandler(
             filename=str(log_dir / "python-ai.log"),
             maxBytes=10 * 1024 * 1024,
@@ -160,8 +180,19 @@ def _configure_std_logging() -> None:
         error_handler.setLevel(logging.WARNING)
         error_handler.setFormatter(_make_json_formatter())
 
-        root.addHandler(main_handler)
-        root.addHandler(error_handler)
+        # 文件写入与轮转放到后台线程，调用线程（含事件循环）只做一次入队
+        record_queue: queue.SimpleQueue = queue.SimpleQueue()
+        listener = QueueListener(
+            record_queue,
+            main_handler,
+            error_handler,
+            respect_handler_level=True,
+        )
+        listener.start()
+        # 进程退出前排空队列，保证最后的日志（含崩溃日志）落盘
+        atexit.register(listener.stop)
+
+        root.addHandler(_RecordQueueHandler(record_queue))
 
     _install_excepthook()
 
@@ -175,9 +206,12 @@ def _configure_structlog() -> None:
     将 structlog 与 stdlib logging 深度集成（ProcessorFormatter 模式）。
     chain 末尾的 wrap_for_formatter 将事件字典交由各 handler 的 ProcessorFormatter 渲染，
     从而实现文件与控制台各自独立的输出格式。
+    chain 首位的 filter_by_level 在任何处理器运行前丢弃未启用级别的事件，
+    避免高频 debug 日志在 INFO 级别下仍然付出时间戳、调用栈等处理开销。
     """
     structlog.configure(
         processors=[
+            structlog.stdlib.filter_by_level,
             *_PRE_CHAIN,
             ProcessorFormatter.wrap_for_formatter,
         ],
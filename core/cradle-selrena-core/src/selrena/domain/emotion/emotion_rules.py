@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from typing import Optional
 
@@ -25,6 +26,21 @@ EMOTION_TRIGGER_RULES: tuple[EmotionTriggerRule, ...] = (
 )
 
 
+# 关键词 → 所属规则序号（同一关键词出现在多条规则时以靠前的规则为准）
+_KEYWORD_RULE_INDEX: dict[str, int] = {}
+for _index, _rule in enumerate(EMOTION_TRIGGER_RULES):
+	for _keyword in _rule.keywords:
+		_KEYWORD_RULE_INDEX.setdefault(_keyword, _index)
+del _index, _rule, _keyword
+
+# 全部关键词编译为单个交替式，按规则顺序排列；零宽前瞻使每个位置都参与匹配，
+# 同一起点上交替式返回规则序号最小的关键词，因此取所有命中中的最小序号
+# 即与「按规则顺序逐条检查」的结果一致
+_KEYWORD_RE = re.compile(
+	"(?=(" + "|".join(re.escape(keyword) for keyword in _KEYWORD_RULE_INDEX) + "))"
+)
+
+
 def infer_emotion_by_input(user_input: str) -> Optional[tuple[str, float]]:
 	"""根据输入命中规则，返回 (emotion_type, intensity_delta)。"""
 
@@ -32,10 +48,17 @@ def infer_emotion_by_input(user_input: str) -> Optional[tuple[str, float]]:
 	if not content:
 		return None
 
-	for rule in EMOTION_TRIGGER_RULES:
-		if any(keyword in content for keyword in rule.keywords):
-			return rule.emotion_type, rule.intensity_delta
-	return None
+	best_index: Optional[int] = None
+	for match in _KEYWORD_RE.finditer(content):
+		index = _KEYWORD_RULE_INDEX[match.group(1)]
+		if best_index is None or index < best_index:
+			best_index = index
+			if best_index == 0:
+				break
+	if best_index is None:
+		return None
+	rule = EMOTION_TRIGGER_RULES[best_index]
+	return rule.emotion_type, rule.intensity_delta
 
 
 DEFAULT_INTENSITY_DECAY_ON_NEUTRAL: float = -0.05
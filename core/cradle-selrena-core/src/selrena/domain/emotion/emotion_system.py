@@ -12,7 +12,6 @@ import time
 from dataclasses import dataclass, field
 from enum import StrEnum
 from uuid import uuid4
-from datetime import datetime
 from selrena.core.exceptions import EmotionException
 from selrena.domain.emotion.emotion_rules import (
     DEFAULT_INTENSITY_DECAY_ON_NEUTRAL,
@@ -51,8 +50,8 @@ class EmotionState:
     trigger: str = ""
     # 全链路追踪ID
     trace_id: str = field(default_factory=lambda: str(uuid4()))
-    # 情绪更新时间
-    timestamp: datetime = field(default_factory=datetime.now)
+    # 情绪更新时刻（time.monotonic() 秒数，仅用于计算衰减间隔，不受系统时钟调整影响）
+    updated_at: float = field(default_factory=time.monotonic)
 
 
 # ======================================
@@ -80,14 +79,14 @@ class EmotionSystem:
         情绪自然衰减，每次操作前都会调用，保证情绪连续
         核心逻辑：情绪强度随时间自然降低，最低保留0.1的基础情绪，不会完全归零
         """
-        now = time.time()
+        now = time.monotonic()
         # 计算距离上次更新的秒数
-        delta_seconds = now - self.current_state.timestamp.timestamp()
+        delta_seconds = now - self.current_state.updated_at
         # 计算衰减后的强度
         new_intensity = self.current_state.intensity * max(0.1, 1 - delta_seconds * self.decay_rate)
         # 更新强度和时间
         self.current_state.intensity = max(0.1, new_intensity)
-        self.current_state.timestamp = datetime.now()
+        self.current_state.updated_at = now
         logger.debug(
             "情绪自然衰减完成",
             current_emotion=self.current_state.emotion_type.value,
@@ -115,7 +114,7 @@ class EmotionSystem:
         self.current_state.intensity = max(0.1, min(1.0, self.current_state.intensity + intensity_delta))
         # 更新触发源和时间
         self.current_state.trigger = trigger
-        self.current_state.timestamp = datetime.now()
+        self.current_state.updated_at = time.monotonic()
 
         logger.info(
             "情绪状态更新完成",
@@ -130,9 +129,7 @@ class EmotionSystem:
         参数：
             user_input: 用户输入的纯文本
         """
-        # 先执行自然衰减
-        self.decay()
-
+        # 自然衰减由 update() 统一执行，此处不再重复衰减
         inferred = infer_emotion_by_input(user_input)
         if inferred is not None:
             emotion_name, intensity_delta = inferred
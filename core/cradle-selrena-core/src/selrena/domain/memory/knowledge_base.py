@@ -55,6 +55,16 @@ class KnowledgeEntry:
     enabled: bool = True
 
 
+@dataclass(frozen=True)
+class _IndexedKnowledge:
+    """通用知识条目的预处理检索特征，写入时计算一次。"""
+
+    content_tokens: frozenset[str]
+    tag_tokens: frozenset[str]
+    # 归一化到 (0, 1] 的优先级
+    priority_ratio: float
+
+
 class KnowledgeBase:
     """独立知识库管理器，全局单例。"""
 
@@ -72,12 +82,18 @@ class KnowledgeBase:
             KnowledgeBaseType.GENERAL: {},
         }
         self._policy = KnowledgeRetrievalPolicy()
+        # 通用知识的检索特征缓存：entry_id → 预分词、预归一化结果
+        self._general_index: Dict[str, _IndexedKnowledge] = {}
+        # 人设知识按优先级排序后的缓存，知识变更时失效（人设知识仅在注入时变化）
+        self._sorted_persona: List[KnowledgeEntry] | None = None
         logger.info("独立知识库初始化完成")
 
     def init_from_kernel(self, payload: KnowledgeBaseInitPayloadModel) -> None:
         """用内核注入的完整知识载荷重建知识库。"""
         self._kb[KnowledgeBaseType.PERSONA].clear()
         self._kb[KnowledgeBaseType.GENERAL].clear()
+        self._general_index.clear()
+        self._sorted_persona = None
         self._policy = KnowledgeRetrievalPolicy(
             persona_top_k=payload.retrieval.persona_top_k,
             general_top_k=payload.retrieval.general_top_k,
@@ -114,13 +130,25 @@ class KnowledgeBase:
 
     def add(self, entry: KnowledgeEntry) -> None:
         self._kb[entry.kb_type][entry.entry_id] = entry
+        if entry.kb_type == KnowledgeBaseType.PERSONA:
+            self._sorted_persona = None
+        else:
+            self._general_index[entry.entry_id] = _IndexedKnowledge(
+                content_tokens=frozenset(self._tokenize(entry.content)),
+                tag_tokens=frozenset(self._normalize_tokens(entry.tags)),
+                priority_ratio=min(max(entry.priority, 1), 100) / 100.0,
+            )
 
     def get_persona_knowledge(self, limit: int | None = None) -> List[KnowledgeEntry]:
         """获取人设知识，默认按策略限制数量。"""
         resolved_limit = limit if limit is not None else self._policy.persona_top_k
-        entries = list(self._kb[KnowledgeBaseType.PERSONA].values())
-        entries.sort(key=lambda item: item.priority, reverse=True)
-        return entries[: max(1, resolved_limit)]
+        if self._sorted_persona is None:
+            self._sorted_persona = sorted(
+                self._kb[KnowledgeBaseType.PERSONA].values(),
+                key=lambda item: item.priority,
+                reverse=True,
+            )
+        return self._sorted_persona[: max(1, resolved_limit)]
 
     def retrieve_general_knowledge(self, query: str, limit: int | None = None) -> List[KnowledgeEntry]:
         """按关键词/标签/优先级综合打分检索通用知识。"""
@@ -129,10 +157,23 @@ class KnowledgeBase:
         if not query_tokens:
             return []
 
+        # 权重与查询长度的归一化因子每次查询只算一次
+        policy = self._policy
+        keyword_scale = policy.keyword_weight / len(query_tokens)
+        tag_scale = policy.tag_weight / len(query_tokens)
+
         scored_entries: List[tuple[float, KnowledgeEntry]] = []
-        for entry in self._kb[KnowledgeBaseType.GENERAL].values():
-            score = self._score_entry(entry, query_tokens)
-            if score >= self._policy.min_score:
+        for entry_id, entry in self._kb[KnowledgeBaseType.GENERAL].items():
+            indexed = self._general_index[entry_id]
+            if indexed.content_tokens:
+                score = (
+                    len(query_tokens & indexed.content_tokens) * keyword_scale
+                    + len(query_tokens & indexed.tag_tokens) * tag_scale
+                    + indexed.priority_ratio * policy.priority_weight
+                )
+            else:
+                score = 0.0
+            if score >= policy.min_score:
                 scored_entries.append((score, entry))
 
         scored_entries.sort(key=lambda item: item[0], reverse=True)
@@ -147,22 +188,6 @@ class KnowledgeBase:
             result.extend(list(knowledge_dict.values()))
         return result
 
-    def _score_entry(self, entry: KnowledgeEntry, query_tokens: set[str]) -> float:
-        content_tokens = self._tokenize(entry.content)
-        if not content_tokens:
-            return 0.0
-
-        tag_tokens = {token for token in self._normalize_tokens(entry.tags)}
-        keyword_ratio = len(query_tokens & content_tokens) / len(query_tokens)
-        tag_ratio = len(query_tokens & tag_tokens) / len(query_tokens) if tag_tokens else 0.0
-        priority_ratio = min(max(entry.priority, 1), 100) / 100.0
-
-        return (
-            keyword_ratio * self._policy.keyword_weight
-            + tag_ratio * self._policy.tag_weight
-            + priority_ratio * self._policy.priority_weight
-        )
-
     def _tokenize(self, text: str) -> set[str]:
         return {token.lower() for token in _TOKEN_RE.findall(text or "")}
 
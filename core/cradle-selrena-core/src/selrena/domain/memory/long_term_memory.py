@@ -13,7 +13,6 @@ from enum import StrEnum
 from uuid import uuid4
 from datetime import datetime
 from typing import List, Dict, Optional
-import asyncio
 from selrena.core.contracts.kernel_ingress_contracts import KernelLongTermMemoryRecord
 from selrena.domain.multimodal.multimodal_content import MultimodalContent
 from selrena.core.event_bus import DomainEvent, DomainEventBus
@@ -23,6 +22,11 @@ from selrena.core.observability.logger import get_logger
 logger = get_logger("long_term_memory")
 
 
+def _extract_keywords(text: str) -> frozenset[str]:
+    """检索用关键词集合：小写后按空白切分（查询与记忆内容共用同一规则）"""
+    return frozenset(text.lower().split())
+
+
 # ======================================
 # 长期记忆类型枚举
 # ======================================
@@ -99,6 +103,12 @@ class LongTermMemory:
         """初始化，仅在单例创建时执行一次"""
         # 记忆存储：key=memory_id，value=LongTermMemoryFragment
         self._memories: Dict[str, LongTermMemoryFragment] = {}
+        # 按类型的二级索引：偏好注入、按类型检索时无需扫描全部记忆
+        self._by_type: Dict[LongTermMemoryType, Dict[str, LongTermMemoryFragment]] = {
+            memory_type: {} for memory_type in LongTermMemoryType
+        }
+        # 记忆内容的关键词缓存：写入时切分一次，检索时直接求交集
+        self._keywords: Dict[str, frozenset[str]] = {}
         # 事件总线
         self._event_bus = DomainEventBus()
         logger.info("长期记忆系统初始化完成")
@@ -109,8 +119,10 @@ class LongTermMemory:
         参数：
             memories: 内核从本地数据库加载的历史记忆列表
         """
-        for mem in memories:
-            fragment = LongTermMemoryFragment(
+        # 批量注入快速路径：一次性构建片段并整体写入，最后统一重建类型索引，
+        # 避免逐条走 _store() 的新旧类型比对
+        fragments = [
+            LongTermMemoryFragment(
                 content=mem.content,
                 memory_type=LongTermMemoryType(mem.memory_type),
                 weight=mem.weight,
@@ -119,7 +131,13 @@ class LongTermMemory:
                 memory_id=mem.memory_id,
                 timestamp=datetime.fromisoformat(mem.timestamp),
             )
-            self._memories[fragment.memory_id] = fragment
+            for mem in memories
+        ]
+        self._memories.update((fragment.memory_id, fragment) for fragment in fragments)
+        self._keywords.update(
+            (fragment.memory_id, _extract_keywords(fragment.content)) for fragment in fragments
+        )
+        self._rebuild_type_index()
         logger.info("历史长期记忆注入完成", memory_count=len(self._memories))
 
     def add(self, fragment: LongTermMemoryFragment) -> None:
@@ -128,14 +146,9 @@ class LongTermMemory:
         参数：
             fragment: 长期记忆片段
         """
-        self._memories[fragment.memory_id] = fragment
-        # 发布同步事件，通知内核持久化（在当前 asyncio loop 中调度为 task）
-        try:
-            loop = asyncio.get_running_loop()
-            loop.create_task(self._event_bus.publish(MemorySyncEvent(memory_fragment=fragment)))
-        except RuntimeError:
-            # 无 event loop（如单元测试），跳过异步发布
-            pass
+        self._store(fragment)
+        # 后台发布同步事件，通知内核持久化
+        self._event_bus.publish_background(MemorySyncEvent(memory_fragment=fragment))
         logger.info(
             "新增长期记忆完成",
             memory_id=fragment.memory_id,
@@ -156,15 +169,18 @@ class LongTermMemory:
             limit: 返回的记忆数量
         返回：按相关度排序的记忆列表
         """
-        query_keywords = set(query.lower().split())
-        scored_memories = []
+        query_keywords = _extract_keywords(query)
+        # 指定类型时直接遍历该类型的索引
+        candidates = self._by_type[memory_type] if memory_type else self._memories
+        # 空查询或无候选记忆时任何记忆得分都为 0，直接跳过全量扫描
+        if not query_keywords or not candidates:
+            return []
 
-        for mem in self._memories.values():
-            # 过滤指定类型
-            if memory_type and mem.memory_type != memory_type:
-                continue
+        scored_memories = []
+        keywords = self._keywords
+        for memory_id, mem in candidates.items():
             # 关键词匹配
-            match_count = len(query_keywords & set(mem.content.lower().split()))
+            match_count = len(query_keywords & keywords[memory_id])
             # 最终得分 = 匹配数 * 记忆权重
             score = match_count * mem.weight
             if score > 0:
@@ -185,7 +201,7 @@ class LongTermMemory:
         获取所有偏好记忆，永久保留，每次prompt都注入
         返回：所有偏好记忆片段列表
         """
-        return [mem for mem in self._memories.values() if mem.memory_type == LongTermMemoryType.PREFERENCE]
+        return list(self._by_type[LongTermMemoryType.PREFERENCE].values())
 
     def decay_all(self) -> None:
         """所有记忆权重自然衰减，每天执行一次"""
@@ -195,4 +211,24 @@ class LongTermMemory:
 
     def get_all_memories(self) -> List[LongTermMemoryFragment]:
         """获取所有记忆，用于内核全量同步"""
-        return list(self._memories.values())
\ No newline at end of file
+        return list(self._memories.values())
+
+    def count(self) -> int:
+        """记忆总数（不复制记忆列表，供高频状态同步使用）"""
+        return len(self._memories)
+
+    def _store(self, fragment: LongTermMemoryFragment) -> None:
+        """写入主存储并维护类型索引（同 ID 覆盖时先移出旧类型桶）"""
+        previous = self._memories.get(fragment.memory_id)
+        if previous is not None and previous.memory_type != fragment.memory_type:
+            self._by_type[previous.memory_type].pop(fragment.memory_id, None)
+        self._memories[fragment.memory_id] = fragment
+        self._by_type[fragment.memory_type][fragment.memory_id] = fragment
+        self._keywords[fragment.memory_id] = _extract_keywords(fragment.content)
+
+    def _rebuild_type_index(self) -> None:
+        """按主存储全量重建类型索引（批量注入后调用）"""
+        for bucket in self._by_type.values():
+            bucket.clear()
+        for memory_id, fragment in self._memories.items():
+            self._by_type[fragment.memory_type][memory_id] = fragment
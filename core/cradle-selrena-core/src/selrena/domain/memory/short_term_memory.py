@@ -8,11 +8,12 @@
 3. 有自动遗忘机制，超过最大长度自动遗忘最早的内容
 4. 绝对不碰本地持久化，持久化由TS内核负责
 """
+from collections import deque
+from itertools import islice
 from dataclasses import dataclass, field
 from uuid import uuid4
 from datetime import datetime
 from typing import List, Optional
-import asyncio
 from selrena.domain.multimodal.multimodal_content import MultimodalContent
 from selrena.core.event_bus import DomainEvent, DomainEventBus
 from selrena.core.observability.logger import get_logger
@@ -78,8 +79,8 @@ class ShortTermMemory:
         self.scene_id = scene_id
         # 最大记忆长度，超过自动遗忘最早的内容
         self.max_length = max_length
-        # 记忆存储
-        self._fragments: List[ShortTermMemoryFragment] = []
+        # 记忆存储（双端队列：遗忘最早内容为 O(1) 的 popleft）
+        self._fragments: deque[ShortTermMemoryFragment] = deque()
         # 事件总线（用于异步同步到内核）
         self._event_bus = DomainEventBus()
         logger.info("短期记忆初始化完成", scene_id=scene_id, max_length=max_length)
@@ -109,7 +110,7 @@ class ShortTermMemory:
 
         # 超过最大长度，自动遗忘最早的内容
         if len(self._fragments) > self.max_length:
-            forgotten = self._fragments.pop(0)
+            forgotten = self._fragments.popleft()
             logger.debug(
                 "自动遗忘最早的短期记忆",
                 scene_id=self.scene_id,
@@ -123,16 +124,10 @@ class ShortTermMemory:
             memory_id=fragment.memory_id
         )
 
-        try:
-            loop = asyncio.get_running_loop()
-            loop.create_task(
-                self._event_bus.publish(
-                    ShortTermMemorySyncEvent(scene_id=self.scene_id, fragment=fragment)
-                )
-            )
-        except RuntimeError:
-            # 无事件循环（如单元测试）时跳过异步发布
-            pass
+        # 后台发布同步事件
+        self._event_bus.publish_background(
+            ShortTermMemorySyncEvent(scene_id=self.scene_id, fragment=fragment)
+        )
 
     def get_context(self, limit: int = 10) -> List[ShortTermMemoryFragment]:
         """
@@ -141,7 +136,11 @@ class ShortTermMemory:
             limit: 返回的记忆数量
         返回：按时间正序排列的记忆片段列表
         """
-        return self._fragments[-limit:]
+        if limit <= 0:
+            # 保持列表切片 [-limit:] 的原有语义（0 返回全部，负数跳过最早的若干条）
+            return list(self._fragments)[-limit:]
+        # 常规路径：从队尾反向只取 limit 条，避免每轮复制整个窗口
+        return list(islice(reversed(self._fragments), limit))[::-1]
 
     def get_context_text(self, limit: int = 10) -> str:
         """
@@ -164,5 +163,5 @@ class ShortTermMemory:
 
     def clear(self) -> None:
         """清空短期记忆，会话结束时由内核触发"""
-        self._fragments = []
+        self._fragments.clear()
         logger.info("短期记忆已清空", scene_id=self.scene_id)
\ No newline at end of file
@@ -123,17 +123,20 @@ class SelrenaSelfEntity:
 
     def get_scene_runtime(self, scene_id: str) -> SceneSessionRuntime:
         """获取指定场景的运行时状态，不存在则自动创建。"""
-        if scene_id not in self._scene_runtimes:
+        # 已存在场景只做一次哈希查找（每轮对话至少调用一次）
+        runtime = self._scene_runtimes.get(scene_id)
+        if runtime is None:
             memory_config = self.inference_config.memory
             short_term_max_length = max(
                 memory_config.context_limit,
                 memory_config.summary_trigger_count,
             )
-            self._scene_runtimes[scene_id] = SceneSessionRuntime(
+            runtime = SceneSessionRuntime(
                 scene_id=scene_id,
                 short_term_max_length=short_term_max_length,
             )
-        return self._scene_runtimes[scene_id]
+            self._scene_runtimes[scene_id] = runtime
+        return runtime
 
     def get_short_term_memory(self, scene_id: str) -> ShortTermMemory:
         """
@@ -170,5 +173,5 @@ class SelrenaSelfEntity:
             "name": self.persona_config.base.nickname,
             "is_awake": self.is_awake,
             "emotion": self.emotion_system.get_state(),
-            "memory_count": len(self.long_term_memory.get_all_memories())
+            "memory_count": self.long_term_memory.count()
         }
\ No newline at end of file
@@ -32,9 +32,18 @@ class ThoughtPool:
 		}
 	)
 
-	def get_candidates(self, emotion_type: str) -> list[str]:
+	# 按情绪预拼接的候选思绪（构造时计算一次，生命时钟每次心跳直接复用）
+	_candidates: dict[str, tuple[str, ...]] = field(init=False, repr=False)
+	_base_candidates: tuple[str, ...] = field(init=False, repr=False)
+
+	def __post_init__(self) -> None:
+		self._base_candidates = tuple(self.base_thoughts)
+		self._candidates = {
+			emotion_type: self._base_candidates + tuple(bias)
+			for emotion_type, bias in self.emotion_bias.items()
+		}
+
+	def get_candidates(self, emotion_type: str) -> tuple[str, ...]:
 		"""返回基础思绪 + 情绪偏置思绪。"""
 
-		result = list(self.base_thoughts)
-		result.extend(self.emotion_bias.get(emotion_type, []))
-		return result
+		return self._candidates.get(emotion_type, self._base_candidates)
@@ -9,7 +9,6 @@
 4. 仅做思维生成，不碰场景规则
 """
 import random
-from typing import List
 from selrena.core.config import PersonaConfig
 from selrena.domain.emotion.emotion_system import EmotionSystem
 from selrena.domain.memory.long_term_memory import LongTermMemory
@@ -55,15 +54,17 @@ class ThoughtSystem:
         核心逻辑：基于当前情绪、记忆、人设，生成符合她性格的思维
         """
         current_emotion = self.emotion_system.current_state.emotion_type.value
-        thought_candidates: List[str] = self._thought_pool.get_candidates(current_emotion)
+        thought_candidates = self._thought_pool.get_candidates(current_emotion)
 
         # 注入轻量反思记忆，不绑定主动思维模式，避免 domain 被单一场景绑死。
+        # 记忆思绪作为额外一个候选参与等概率抽取，命中时才拼接文本，不复制候选列表。
         all_memories = self.long_term_memory.get_all_memories()
-        if all_memories:
+        pick = random.randrange(len(thought_candidates) + (1 if all_memories else 0))
+        if pick < len(thought_candidates):
+            thought = thought_candidates[pick]
+        else:
             selected = random.choice(all_memories)
-            thought_candidates.append(f"想到一段记忆：{selected.content[:24]}")
-
-        thought = random.choice(thought_candidates)
+            thought = f"想到一段记忆：{selected.content[:24]}"
         logger.debug("主动思维生成完成", thought=thought)
 
         return thought
\ No newline at end of file
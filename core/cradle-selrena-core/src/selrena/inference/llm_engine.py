@@ -86,6 +86,8 @@ class LLMEngine:
         self.config = self_entity.inference_config.model
         self.llm_config = llm_config
         self._model = None
+        # provider_key → 解析后的 LLMConfig；配置冻结不可变，每个 key 只需解析一次
+        self._provider_config_cache: dict[str | None, LLMConfig | None] = {}
         logger.info("LLM引擎初始化完成", model_path=self.config.local_model_path, llm_config=self.llm_config)
 
     def _load_local_model(self) -> None:
@@ -113,6 +115,15 @@ class LLMEngine:
         return ""
 
     def _resolve_provider_config(self, provider_key: str | None) -> LLMConfig | None:
+        """解析 provider_key 对应的 LLMConfig，按 key 缓存解析结果。"""
+        try:
+            return self._provider_config_cache[provider_key]
+        except KeyError:
+            cfg = self._build_provider_config(provider_key)
+            self._provider_config_cache[provider_key] = cfg
+            return cfg
+
+    def _build_provider_config(self, provider_key: str | None) -> LLMConfig | None:
         """将 provider_key 解析为内部可用的 LLMConfig（model 字段已填充）。
 
         支持三种格式：
@@ -200,10 +211,16 @@ class LLMEngine:
         model_name = cfg.model or (
             "deepseek-chat" if api_type == "deepseek" else self.config.local_model_path
         )
-        prompt_text = self._render_messages_as_prompt(llm_request)
+        is_chat_endpoint = request_path.endswith("/chat/completions")
         message_payload = _build_message_payload(llm_request.messages)
+        # 纯文本 prompt 仅 completions 端点与自定义模板会用到，chat 端点跳过渲染
+        prompt_text = (
+            self._render_messages_as_prompt(llm_request)
+            if cfg.request_body_template or not is_chat_endpoint
+            else ""
+        )
 
-        if request_path.endswith("/chat/completions"):
+        if is_chat_endpoint:
             default_payload: dict = {
                 "model": model_name,
                 "messages": message_payload,
@@ -221,11 +238,13 @@ class LLMEngine:
         if cfg.request_body_template:
             template = cfg.request_body_template
             try:
+                # messages / messages_json 两个占位符内容相同，只序列化一次
+                messages_json = json.dumps(message_payload, ensure_ascii=False)
                 body_text = template.format(
                     prompt=prompt_text,
                     prompt_json=json.dumps(prompt_text, ensure_ascii=False),
-                    messages=json.dumps(message_payload, ensure_ascii=False),
-                    messages_json=json.dumps(message_payload, ensure_ascii=False),
+                    messages=messages_json,
+                    messages_json=messages_json,
                     model=default_payload["model"],
                     temperature=default_payload["temperature"],
                 )
@@ -21,11 +21,11 @@
       modality / uri / mime_type / description_hint / metadata["visual_kind"]
   - vision_prompt 根据 visual_kind 动态生成，在文本侧标记图片语义性质
 """
-import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import List
+from typing import TYPE_CHECKING, List
 
-from selrena.core.config import InferenceConfig, LLMConfig
+from selrena.core.config import InferenceConfig
 from selrena.core.contracts.kernel_ingress_contracts import (
     PerceptionEventContentModel,
     PerceptionModalityItemModel,
@@ -33,6 +33,9 @@ from selrena.core.contracts.kernel_ingress_contracts import (
 from selrena.core.exceptions import InferenceException
 from selrena.core.observability.logger import get_logger
 
+if TYPE_CHECKING:
+    from selrena.inference.llm_engine import LLMEngine
+
 logger = get_logger("multimodal_router")
 
 
@@ -92,6 +95,21 @@ _VISUAL_KIND_PROMPTS: dict[str, str] = {
     ),
 }
 
+# 专家模式下同时在途的视觉请求上限（max_items 之外的第二道闸，避免打满上游限流）
+_SPECIALIST_MAX_WORKERS = 4
+
+
+@dataclass(frozen=True)
+class _SpecialistJob:
+    """专家模式下单个媒体项的描述任务。"""
+    item: PerceptionModalityItemModel
+    index: int          # 同类媒体内的序号（从 1 开始），用于 [图片1] 形式的标注
+    kind: str           # visual_kind：sticker / image / video
+    label: str          # 描述前缀中的中文类别名
+    default_mime: str   # item 未携带 mime_type 时的兜底值
+    provider: str       # 调用的推理提供商 key
+
+
 def _build_vision_prompt(item: PerceptionModalityItemModel) -> str:
     """根据 visual_kind 选择合适的视觉提示词，并附加 description_hint。"""
     kind = str(item.metadata.get("visual_kind", "image"))
@@ -114,9 +132,9 @@ class MultimodalRouter:
 
     def __init__(self, inference_config: InferenceConfig) -> None:
         self._config = inference_config
-        self._llm_engine = None   # 延迟注入，由 container 调用 set_llm_engine()
+        self._llm_engine: "LLMEngine | None" = None   # 延迟注入，由 container 调用 set_llm_engine()
 
-    def set_llm_engine(self, llm_engine: object) -> None:
+    def set_llm_engine(self, llm_engine: "LLMEngine") -> None:
         """注入 LLMEngine 实例（避免构造时循环依赖）。"""
         self._llm_engine = llm_engine
 
@@ -235,65 +253,74 @@ class MultimodalRouter:
     ) -> str:
         """调用专家视觉模型对每个媒体项生成自然语言描述，汇总为字符串。
 
-        每项调用均向 LLMEngine.generate() 发送包含 vision_url 的单轮请求。
+        每项调用均向 LLMEngine.generate() 发送包含 vision_url 的单轮请求，
+        多个媒体项通过线程池并发执行。
         API 调用失败时降级为占位描述，不抛出异常（避免中断对话流）。
         """
-        if self._llm_engine is None:
+        llm_engine = self._llm_engine
+        if llm_engine is None:
             logger.warning("LLMEngine 未注入，多模态专家调用降级为占位描述")
             return self._fallback_description(image_items, video_items)
 
-        from selrena.inference.llm_engine import LLMMessage, LLMRequest
-
-        desc_parts: list[str] = []
-
+        # 每个媒体项一次独立的网络往返，彼此无依赖：多于一项时并发发出，
+        # 按原顺序汇总，整体耗时约等于最慢的一次调用
+        jobs: list[_SpecialistJob] = []
         for idx, img in enumerate(image_items, 1):
             kind = str(img.metadata.get("visual_kind", "image"))
-            prompt = _build_vision_prompt(img)
-            label = "表情包" if kind == "sticker" else "图片"
-            try:
-                req = LLMRequest(messages=[
-                    LLMMessage(
-                        role="user",
-                        content=prompt,
-                        vision_url=img.uri,
-                        vision_mime=img.mime_type or "image/jpeg",
-                    )
-                ])
-                description = self._llm_engine.generate(req, provider_key=image_provider)
-                desc_parts.append(f"[{label}{idx}] {description.strip()}")
-                logger.debug(
-                    "视觉专家模型描述完成",
-                    index=idx, kind=kind, provider=image_provider,
-                )
-            except (InferenceException, Exception) as e:
-                fallback = img.description_hint or f"无法识别的{label}"
-                desc_parts.append(f"[{label}{idx}] {fallback}（描述失败：{e}）")
-                logger.warning("专家视觉调用失败，使用占位描述", index=idx, error=str(e))
-
+            jobs.append(_SpecialistJob(
+                item=img,
+                index=idx,
+                kind=kind,
+                label="表情包" if kind == "sticker" else "图片",
+                default_mime="image/jpeg",
+                provider=image_provider,
+            ))
         for idx, vid in enumerate(video_items, 1):
-            prompt = _build_vision_prompt(vid)
-            try:
-                req = LLMRequest(messages=[
-                    LLMMessage(
-                        role="user",
-                        content=prompt,
-                        vision_url=vid.uri,
-                        vision_mime=vid.mime_type or "video/mp4",
-                    )
-                ])
-                description = self._llm_engine.generate(req, provider_key=video_provider)
-                desc_parts.append(f"[视频{idx}] {description.strip()}")
-                logger.debug(
-                    "视觉专家模型描述完成",
-                    index=idx, kind="video", provider=video_provider,
-                )
-            except (InferenceException, Exception) as e:
-                fallback = vid.description_hint or "无法识别的视频"
-                desc_parts.append(f"[视频{idx}] {fallback}（描述失败：{e}）")
-                logger.warning("专家视频调用失败，使用占位描述", index=idx, error=str(e))
-
+            jobs.append(_SpecialistJob(
+                item=vid,
+                index=idx,
+                kind="video",
+                label="视频",
+                default_mime="video/mp4",
+                provider=video_provider,
+            ))
+
+        if len(jobs) == 1:
+            return self._describe_item(llm_engine, jobs[0])
+
+        max_workers = min(len(jobs), _SPECIALIST_MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="vision-specialist") as pool:
+            desc_parts = list(pool.map(lambda job: self._describe_item(llm_engine, job), jobs))
         return "\n".join(desc_parts)
 
+    @staticmethod
+    def _describe_item(llm_engine: "LLMEngine", job: _SpecialistJob) -> str:
+        """调用专家视觉模型描述单个媒体项，失败时返回占位描述。"""
+        from selrena.inference.llm_engine import LLMMessage, LLMRequest
+
+        item, idx, kind, label = job.item, job.index, job.kind, job.label
+        provider = job.provider
+        prompt = _build_vision_prompt(item)
+        try:
+            req = LLMRequest(messages=[
+                LLMMessage(
+                    role="user",
+                    content=prompt,
+                    vision_url=item.uri,
+                    vision_mime=item.mime_type or job.default_mime,
+                )
+            ])
+            description = llm_engine.generate(req, provider_key=provider)
+            logger.debug(
+                "视觉专家模型描述完成",
+                index=idx, kind=kind, provider=provider,
+            )
+            return f"[{label}{idx}] {description.strip()}"
+        except (InferenceException, Exception) as e:
+            fallback = item.description_hint or f"无法识别的{label}"
+            logger.warning("专家视觉调用失败，使用占位描述", index=idx, kind=kind, error=str(e))
+            return f"[{label}{idx}] {fallback}（描述失败：{e}）"
+
     @staticmethod
     def _fallback_description(
         image_items: List[PerceptionModalityItemModel],
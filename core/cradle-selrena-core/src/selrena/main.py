@@ -17,16 +17,13 @@ from typing import Final
 
 # Ensure that `selrena` package can be imported when run from source (without installing). This is
 # especially important when the TS kernel launches Python via `python -m selrena.main`.
-# It locates the repository root by walking upward until it finds a `pyproject.toml` or `pnpm-workspace.yaml`.
+# It locates the repository root by walking upward until it finds `pnpm-workspace.yaml`
+# (a nested pyproject.toml only marks the subpackage, so it is not probed).
 # Then it prepends the Python source directory to sys.path.
 repo_root = Path(__file__).resolve()
 for _ in range(20):
-    # Prefer the monorepo root marker. If not found, fallback to pyproject.toml.
     if (repo_root / "pnpm-workspace.yaml").exists():
         break
-    if (repo_root / "pyproject.toml").exists():
-        # Note: this pyproject may be inside a subpackage; keep searching for pnpm-workspace.yaml.
-        pass
     if repo_root.parent == repo_root:
         break
     repo_root = repo_root.parent
@@ -36,7 +33,8 @@ if str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
 
 # On Windows, asyncio defaults to ProactorEventLoop which is incompatible with zmq's add_reader.
-# Ensure selector policy is set before any zmq/asyncio interaction.
+# Ensure selector policy is set before any zmq/asyncio interaction (once, at import time;
+# main() relies on this instead of installing the policy a second time).
 if sys.platform == "win32":
     try:
         asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
@@ -230,14 +228,7 @@ def main():
     # 创建AI核心实例
     ai_core = PythonAICore(config=config, bind_address=bind_address)
 
-    # 启动事件循环
-    # Windows 默认使用 ProactorEventLoop，但 zmq 需要 selector-style loop.
-    if sys.platform == "win32":
-        try:
-            asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
-        except AttributeError:
-            pass
-
+    # 启动事件循环（Windows selector 策略已在模块导入时设置）
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
 
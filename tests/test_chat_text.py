@@ -0,0 +1,27 @@
+import pytest
+
+from selrena.application.chat_use_case import _strip_emotion_tags
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        # 无标签：原样返回（仅去首尾空白、合并连续空格）
+        ("你好呀", "你好呀"),
+        ("  你好  世界  ", "你好 世界"),
+        # 任意位置的括号标签
+        ("[开心] 今天真好", "今天真好"),
+        ("今天 (happy) 真好", "今天 真好"),
+        ("【 emotion: 思考 】嗯……", "嗯……"),
+        ("《害羞》<shy>别看我", "别看我"),
+        # 行首无括号前缀，包括剥除括号标签后才暴露出来的前缀
+        ("情绪：开心 你好", "你好"),
+        ("  Emotion: calm  hi", "hi"),
+        ("[开心]  emotion: happy  嗨", "嗨"),
+        # 非情绪词的括号内容保留；非行首的前缀不剥除
+        ("(笑) 好的", "(笑) 好的"),
+        ("你说 情绪：开心 吗", "你说 情绪：开心 吗"),
+    ],
+)
+def test_strip_emotion_tags(raw: str, expected: str) -> None:
+    assert _strip_emotion_tags(raw) == expected
@@ -0,0 +1,42 @@
+import pytest
+
+from selrena.domain.emotion.emotion_rules import infer_emotion_by_input
+
+
+@pytest.mark.parametrize(
+    ("user_input", "expected_emotion"),
+    [
+        ("我好喜欢你", "happy"),
+        ("气死了", "angry"),
+        ("你在看什么", "curious"),
+        ("有点难过", "sad"),
+    ],
+)
+def test_single_rule_hit(user_input: str, expected_emotion: str) -> None:
+    result = infer_emotion_by_input(user_input)
+    assert result is not None
+    assert result[0] == expected_emotion
+
+
+def test_earlier_rule_wins_regardless_of_text_position() -> None:
+    # angry 关键词在文本中更靠前，但 happy 规则排序更靠前
+    assert infer_emotion_by_input("气死了，不过还是喜欢你")[0] == "happy"
+    # curious（什么）在前、sulky（不理你）在后，规则顺序 sulky 优先
+    assert infer_emotion_by_input("什么嘛，不理你了")[0] == "sulky"
+
+
+def test_overlapping_keywords_resolve_to_earlier_rule() -> None:
+    # 「讨厌啦」(shy) 与「讨厌」(angry) 起点相同，按规则顺序命中 shy
+    assert infer_emotion_by_input("讨厌啦")[0] == "shy"
+    assert infer_emotion_by_input("真讨厌")[0] == "angry"
+    # 重叠关键词之后仍有更高优先级规则时，以更高优先级为准
+    assert infer_emotion_by_input("讨厌啦，谢谢你")[0] == "happy"
+
+
+def test_returns_rule_intensity_delta() -> None:
+    assert infer_emotion_by_input("谢谢") == ("happy", 0.30)
+
+
+@pytest.mark.parametrize("user_input", ["", "   ", "今天天气一般"])
+def test_no_match_returns_none(user_input: str) -> None:
+    assert infer_emotion_by_input(user_input) is None
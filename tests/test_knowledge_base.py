@@ -0,0 +1,77 @@
+import pytest
+
+from selrena.core.contracts.kernel_ingress_contracts import (
+    KernelKnowledgeRecord,
+    KnowledgeBaseInitPayloadModel,
+)
+from selrena.domain.memory.knowledge_base import KnowledgeBase
+
+
+@pytest.fixture
+def knowledge_base(monkeypatch: pytest.MonkeyPatch) -> KnowledgeBase:
+    monkeypatch.setattr(KnowledgeBase, "_instance", None)
+    return KnowledgeBase()
+
+
+def make_payload(*records: KernelKnowledgeRecord) -> KnowledgeBaseInitPayloadModel:
+    return KnowledgeBaseInitPayloadModel(entries=list(records))
+
+
+def general(entry_id: str, content: str, **kwargs: object) -> KernelKnowledgeRecord:
+    return KernelKnowledgeRecord(entry_id=entry_id, scope="general", content=content, **kwargs)
+
+
+def persona(entry_id: str, content: str, priority: int) -> KernelKnowledgeRecord:
+    return KernelKnowledgeRecord(entry_id=entry_id, scope="persona", content=content, priority=priority)
+
+
+def retrieved_ids(kb: KnowledgeBase, query: str) -> list[str]:
+    return [entry.entry_id for entry in kb.retrieve_general_knowledge(query)]
+
+
+def test_general_retrieval_matches_content_and_tags(knowledge_base: KnowledgeBase) -> None:
+    knowledge_base.init_from_kernel(make_payload(
+        general("cat", "猫喜欢吃鱼"),
+        general("tea", "red tea recipe", tags=["drink"]),
+    ))
+
+    assert retrieved_ids(knowledge_base, "猫") == ["cat"]
+    assert retrieved_ids(knowledge_base, "drink") == ["tea"]
+    assert retrieved_ids(knowledge_base, "") == []
+
+
+def test_reinjection_rebuilds_general_index(knowledge_base: KnowledgeBase) -> None:
+    knowledge_base.init_from_kernel(make_payload(
+        general("a", "猫喜欢吃鱼"),
+        general("b", "狗喜欢骨头"),
+    ))
+    knowledge_base.init_from_kernel(make_payload(
+        general("a", "兔子喜欢胡萝卜"),
+    ))
+
+    # 旧内容的分词缓存与被移除的条目都不应残留
+    assert retrieved_ids(knowledge_base, "猫") == []
+    assert retrieved_ids(knowledge_base, "狗") == []
+    assert retrieved_ids(knowledge_base, "兔") == ["a"]
+
+
+def test_reinjection_skips_disabled_entries(knowledge_base: KnowledgeBase) -> None:
+    knowledge_base.init_from_kernel(make_payload(general("a", "猫喜欢吃鱼")))
+    knowledge_base.init_from_kernel(make_payload(general("a", "猫喜欢吃鱼", enabled=False)))
+
+    assert retrieved_ids(knowledge_base, "猫") == []
+
+
+def test_reinjection_resorts_persona_knowledge(knowledge_base: KnowledgeBase) -> None:
+    knowledge_base.init_from_kernel(make_payload(
+        persona("low", "low", priority=1),
+        persona("high", "high", priority=9),
+    ))
+    assert [entry.entry_id for entry in knowledge_base.get_persona_knowledge()] == ["high", "low"]
+
+    knowledge_base.init_from_kernel(make_payload(
+        persona("low", "low", priority=10),
+        persona("high", "high", priority=9),
+        persona("new", "new", priority=5),
+    ))
+    assert [entry.entry_id for entry in knowledge_base.get_persona_knowledge()] == ["low", "high", "new"]
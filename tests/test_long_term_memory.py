@@ -0,0 +1,68 @@
+import pytest
+
+from selrena.core.contracts.kernel_ingress_contracts import KernelLongTermMemoryRecord
+from selrena.domain.memory.long_term_memory import (
+    LongTermMemory,
+    LongTermMemoryFragment,
+    LongTermMemoryType,
+)
+
+
+@pytest.fixture
+def long_term_memory(monkeypatch: pytest.MonkeyPatch) -> LongTermMemory:
+    monkeypatch.setattr(LongTermMemory, "_instance", None)
+    return LongTermMemory()
+
+
+def record(memory_id: str, content: str, memory_type: str) -> KernelLongTermMemoryRecord:
+    return KernelLongTermMemoryRecord(
+        memory_id=memory_id,
+        content=content,
+        memory_type=memory_type,
+        timestamp="2025-01-01T00:00:00",
+    )
+
+
+def test_init_from_kernel_builds_type_and_keyword_indexes(long_term_memory: LongTermMemory) -> None:
+    long_term_memory.init_from_kernel([
+        record("p1", "likes green tea", "preference"),
+        record("e1", "talked about green apples", "episodic"),
+    ])
+
+    assert [mem.memory_id for mem in long_term_memory.get_preference_memory()] == ["p1"]
+    assert {mem.memory_id for mem in long_term_memory.retrieve_relevant("green")} == {"p1", "e1"}
+    assert [
+        mem.memory_id
+        for mem in long_term_memory.retrieve_relevant("green", memory_type=LongTermMemoryType.EPISODIC)
+    ] == ["e1"]
+    assert long_term_memory.count() == 2
+
+
+def test_reinjection_moves_memory_between_type_buckets(long_term_memory: LongTermMemory) -> None:
+    long_term_memory.init_from_kernel([record("m1", "likes green tea", "preference")])
+    long_term_memory.init_from_kernel([record("m1", "drank black coffee", "fact")])
+
+    assert long_term_memory.get_preference_memory() == []
+    assert long_term_memory.retrieve_relevant("green") == []
+    assert [
+        mem.memory_id
+        for mem in long_term_memory.retrieve_relevant("coffee", memory_type=LongTermMemoryType.FACT)
+    ] == ["m1"]
+
+
+def test_add_overwrite_updates_indexes(long_term_memory: LongTermMemory) -> None:
+    long_term_memory.add(LongTermMemoryFragment(
+        content="likes green tea",
+        memory_type=LongTermMemoryType.PREFERENCE,
+        memory_id="m1",
+    ))
+    long_term_memory.add(LongTermMemoryFragment(
+        content="visited the sea",
+        memory_type=LongTermMemoryType.EPISODIC,
+        memory_id="m1",
+    ))
+
+    assert long_term_memory.get_preference_memory() == []
+    assert long_term_memory.retrieve_relevant("tea") == []
+    assert [mem.memory_id for mem in long_term_memory.retrieve_relevant("sea")] == ["m1"]
+    assert long_term_memory.count() == 1